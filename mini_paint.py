@@ -4,6 +4,8 @@ import math
 from enum import Enum
 from typing import Tuple, List, Optional
 import os
+import zlib
+from collections import deque
 
 # Initialize Pygame
 pygame.init()
@@ -40,6 +42,21 @@ COLOR_PALETTE = [
     (255, 128, 255), (128, 255, 255), (255, 192, 128), (192, 128, 255)
 ]
 
+# Rendered text cache, keyed by (font id, text, color)
+TEXT_CACHE_SIZE = 128
+_text_cache = {}
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing a cached surface when possible"""
+    key = (id(font), text, color)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        text_surface = font.render(text, True, color)
+        _text_cache[key] = text_surface
+    return text_surface
+
 class Tool(Enum):
     BRUSH = "brush"
     PEN = "pen"
@@ -52,16 +69,38 @@ class Tool(Enum):
     STAR = "star"
     HEART = "heart"
 
+# Tool groups
+FREEHAND_TOOLS = frozenset({Tool.BRUSH, Tool.PEN, Tool.MARKER, Tool.ERASER})
+SHAPE_TOOLS = frozenset({Tool.LINE, Tool.RECTANGLE, Tool.CIRCLE, Tool.TRIANGLE, Tool.STAR, Tool.HEART})
+
+# Stroke width multiplier applied to the brush size for each freehand tool
+BRUSH_SIZE_MULT = {Tool.BRUSH: 1.0, Tool.PEN: 0.5, Tool.MARKER: 1.5, Tool.ERASER: 1.0}
+
+# Unit-circle star vertices as (cos, sin, is_outer), starting at the top
+STAR_UNIT_POINTS = [
+    (math.cos(i * math.pi / 5 - math.pi / 2), math.sin(i * math.pi / 5 - math.pi / 2), i % 2 == 0)
+    for i in range(10)
+]
+
+# Toolbar tool buttons (3 columns)
+TOOL_BUTTONS = [
+    (Tool.BRUSH, "🖌️"), (Tool.PEN, "✏️"), (Tool.MARKER, "🖍️"),
+    (Tool.ERASER, "🧽"), (Tool.LINE, "📏"), (Tool.RECTANGLE, "⬜"),
+    (Tool.CIRCLE, "⭕"), (Tool.TRIANGLE, "🔺"), (Tool.STAR, "⭐"),
+    (Tool.HEART, "❤️")
+]
+
 class MiniPaint:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Mini Paint - Professional Digital Art Studio")
         
-        # Canvas setup
-        self.canvas = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
+        # Canvas setup (converted to the display format for fast blits)
+        self.canvas = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT)).convert()
         self.canvas.fill(WHITE)
-        self.preview_surface = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
+        self.preview_surface = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT), pygame.SRCALPHA).convert_alpha()
         self.preview_surface.set_alpha(200)
+        self._prev_preview_rect: Optional[pygame.Rect] = None
         
         # Drawing state
         self.current_tool = Tool.BRUSH
@@ -69,19 +108,30 @@ class MiniPaint:
         self.brush_size = 5
         self.opacity = 255
         self.is_drawing = False
+        self._mouse_down = False
         self.last_pos = None
         self.start_pos = None
         self.show_preview = True
+        self._stroke_color = self.current_color
+        self._stroke_size = self.brush_size
         
         # History for undo/redo
-        self.history = [self.canvas.copy()]
-        self.history_index = 0
         self.max_history = 50
+        self.history = deque([self._snapshot_canvas()], maxlen=self.max_history)
+        self._redo_stack = deque()
         
         # UI state
         self.show_landing = True
         self.color_picker_open = False
         
+        # Screen areas to upload on the next display update
+        self._dirty: List[pygame.Rect] = [self.screen.get_rect()]
+        self._shown_landing = self.show_landing
+        self._ui_state = None
+        
+        # Rendered status bar text, refreshed whenever _ui_state changes
+        self._status_surf = None
+        
         # Fonts
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 32)
@@ -90,98 +140,163 @@ class MiniPaint:
         # Clock for FPS
         self.clock = pygame.time.Clock()
         
+        # Shape tool drawers: (surface, color, width, start, end) -> bounding rect
+        self._shape_drawers = {
+            Tool.LINE: lambda s, c, w, p0, p1: pygame.draw.line(s, c, p0, p1, w),
+            Tool.RECTANGLE: self._draw_rect_from_points,
+            Tool.CIRCLE: self._draw_circle_from_points,
+            Tool.TRIANGLE: self._draw_triangle_from_points,
+            Tool.STAR: self._draw_star_from_points,
+            Tool.HEART: self._draw_heart_from_points,
+        }
+        
+        # Pre-rendered landing page gradient
+        self._landing_bg = self._build_landing_background()
+        
+        # Brush size slider track, below the tool buttons and size label
+        self._slider_rect = pygame.Rect(20, 100 + len(TOOL_BUTTONS) // 3 * 50 + 80, 250, 20)
+        
+        # Pre-rendered toolbar chrome and tool button labels
+        self._toolbar_cache = pygame.Surface((TOOLBAR_WIDTH + 2, WINDOW_HEIGHT)).convert()
+        self._build_toolbar_cache()
+        self._tool_icon_cache = {}
+        for tool, icon in TOOL_BUTTONS:
+            self._tool_icon_cache[tool] = {
+                False: self.font_medium.render(icon, True, BLACK),
+                True: self.font_medium.render(icon, True, WHITE),
+            }
+        
+    def _snapshot_canvas(self, pixels: Optional[bytes] = None) -> Tuple[int, int, int, bytes]:
+        """Capture the canvas pixels as a (width, height, hash, compressed data) history entry"""
+        width, height = self.canvas.get_size()
+        if pixels is None:
+            pixels = pygame.image.tobytes(self.canvas, "RGB")
+        return (width, height, hash(pixels), zlib.compress(pixels, 1))
+    
+    def _restore_canvas(self, entry: Tuple[int, int, int, bytes]):
+        """Replace the canvas with a compressed history entry"""
+        width, height, _, data = entry
+        self.canvas = pygame.image.frombytes(zlib.decompress(data), (width, height), "RGB").convert()
+    
     def save_state(self):
         """Save current canvas state to history"""
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
+        # Skip no-op actions such as a click that left the canvas unchanged
+        pixels = pygame.image.tobytes(self.canvas, "RGB")
+        if hash(pixels) == self.history[-1][2]:
+            return
         
-        self.history.append(self.canvas.copy())
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-        else:
-            self.history_index += 1
+        self.history.append(self._snapshot_canvas(pixels))
+        self._redo_stack.clear()
     
     def undo(self):
         """Undo last action"""
-        if self.history_index > 0:
-            self.history_index -= 1
-            self.canvas = self.history[self.history_index].copy()
+        if len(self.history) > 1:
+            self._redo_stack.append(self.history.pop())
+            self._restore_canvas(self.history[-1])
+            self.mark_canvas_dirty(self.canvas.get_rect())
     
     def redo(self):
         """Redo last undone action"""
-        if self.history_index < len(self.history) - 1:
-            self.history_index += 1
-            self.canvas = self.history[self.history_index].copy()
+        if self._redo_stack:
+            self.history.append(self._redo_stack.pop())
+            self._restore_canvas(self.history[-1])
+            self.mark_canvas_dirty(self.canvas.get_rect())
     
     def clear_canvas(self):
         """Clear the entire canvas"""
         self.canvas.fill(WHITE)
+        self.mark_canvas_dirty(self.canvas.get_rect())
         self.save_state()
     
-    def get_canvas_pos(self, screen_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-        """Convert screen position to canvas position"""
-        canvas_x = TOOLBAR_WIDTH + 20
-        canvas_y = HEADER_HEIGHT + 20
-        
-        x, y = screen_pos
-        canvas_rel_x = x - canvas_x
-        canvas_rel_y = y - canvas_y
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None):
+        """Queue a screen area (default: the whole screen) for the next display update"""
+        self._dirty.append(rect if rect is not None else self.screen.get_rect())
+    
+    def mark_canvas_dirty(self, rect: Optional[pygame.Rect]):
+        """Queue a canvas-space area for the next display update"""
+        if rect:
+            self.mark_dirty(rect.move(TOOLBAR_WIDTH + 20, HEADER_HEIGHT + 20))
+    
+    def update_display(self):
+        """Upload the dirty screen areas, falling back to a full flip for large updates"""
+        if not self._dirty:
+            return
         
-        if 0 <= canvas_rel_x < CANVAS_WIDTH and 0 <= canvas_rel_y < CANVAS_HEIGHT:
-            return (canvas_rel_x, canvas_rel_y)
-        return None
+        dirty_area = sum(rect.width * rect.height for rect in self._dirty)
+        if dirty_area > WINDOW_WIDTH * WINDOW_HEIGHT // 4:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty)
+        self._dirty.clear()
+    
+    def get_canvas_pos(self, screen_pos: Tuple[int, int]) -> Tuple[int, int, bool]:
+        """Convert screen position to canvas position, plus whether it lies on the canvas"""
+        canvas_rel_x = screen_pos[0] - (TOOLBAR_WIDTH + 20)
+        canvas_rel_y = screen_pos[1] - (HEADER_HEIGHT + 20)
+        
+        # A bitwise OR of two ints is negative iff either of them is
+        inside = (canvas_rel_x | canvas_rel_y) >= 0 and canvas_rel_x < CANVAS_WIDTH and canvas_rel_y < CANVAS_HEIGHT
+        return canvas_rel_x, canvas_rel_y, inside
     
     def draw_line_smooth(self, surface: pygame.Surface, start: Tuple[int, int], 
-                        end: Tuple[int, int], color: Tuple[int, int, int], width: int):
-        """Draw a smooth line between two points"""
+                        end: Tuple[int, int], color: Tuple[int, int, int], width: int) -> pygame.Rect:
+        """Draw a smooth line between two points and return its bounding rect"""
+        # Caps and body share one radius; clamp so thin pens still leave a dab
+        radius = max(1, width // 2)
         if start == end:
-            pygame.draw.circle(surface, color, start, width // 2)
-            return
+            return pygame.draw.circle(surface, color, start, radius)
         
-        # Calculate distance and steps for smooth line
+        # Offset perpendicular to the stroke so the body covers the same 2 * radius pixels as the caps
         dx = end[0] - start[0]
         dy = end[1] - start[1]
         distance = math.sqrt(dx * dx + dy * dy)
+        offset_x = -dy / distance * (radius - 0.5)
+        offset_y = dx / distance * (radius - 0.5)
         
-        if distance == 0:
-            return
-        
-        steps = int(distance)
-        for i in range(steps + 1):
-            t = i / max(steps, 1)
-            x = int(start[0] + t * dx)
-            y = int(start[1] + t * dy)
-            pygame.draw.circle(surface, color, (x, y), width // 2)
+        # Draw the whole segment natively as a quad, then round off both ends
+        points = [
+            (start[0] + offset_x, start[1] + offset_y),
+            (end[0] + offset_x, end[1] + offset_y),
+            (end[0] - offset_x, end[1] - offset_y),
+            (start[0] - offset_x, start[1] - offset_y)
+        ]
+        body_rect = pygame.draw.polygon(surface, color, points)
+        start_cap = pygame.draw.circle(surface, color, start, radius)
+        end_cap = pygame.draw.circle(surface, color, end, radius)
+        return body_rect.unionall([start_cap, end_cap])
+    
+    def stamp_stroke(self, start: Tuple[int, int], end: Tuple[int, int]):
+        """Stamp a segment of the current freehand stroke onto the canvas"""
+        # Hold one lock across the line and cap draws instead of one per primitive
+        self.canvas.lock()
+        try:
+            dirty_rect = self.draw_line_smooth(self.canvas, start, end, self._stroke_color, self._stroke_size)
+        finally:
+            self.canvas.unlock()
+        self.mark_canvas_dirty(dirty_rect)
     
     def draw_star(self, surface: pygame.Surface, center: Tuple[int, int], 
-                  radius: int, color: Tuple[int, int, int], width: int):
-        """Draw a star shape"""
-        points = []
-        for i in range(10):
-            angle = i * math.pi / 5
-            if i % 2 == 0:
-                r = radius
-            else:
-                r = radius // 2
-            x = center[0] + int(r * math.cos(angle - math.pi / 2))
-            y = center[1] + int(r * math.sin(angle - math.pi / 2))
-            points.append((x, y))
+                  radius: int, color: Tuple[int, int, int], width: int) -> pygame.Rect:
+        """Draw a star shape and return its bounding rect"""
+        inner_radius = radius // 2
+        points = [
+            (center[0] + int((radius if is_outer else inner_radius) * ux),
+             center[1] + int((radius if is_outer else inner_radius) * uy))
+            for ux, uy, is_outer in STAR_UNIT_POINTS
+        ]
         
-        if width == 1:
-            pygame.draw.polygon(surface, color, points, width)
-        else:
-            pygame.draw.polygon(surface, color, points, width)
+        return pygame.draw.polygon(surface, color, points, width)
     
     def draw_heart(self, surface: pygame.Surface, center: Tuple[int, int], 
-                   size: int, color: Tuple[int, int, int], width: int):
-        """Draw a heart shape"""
+                   size: int, color: Tuple[int, int, int], width: int) -> pygame.Rect:
+        """Draw a heart shape and return its bounding rect"""
         # Simplified heart using circles and triangle
         x, y = center
         heart_size = size // 2
         
         # Top circles
-        pygame.draw.circle(surface, color, (x - heart_size//2, y - heart_size//3), heart_size//2, width)
-        pygame.draw.circle(surface, color, (x + heart_size//2, y - heart_size//3), heart_size//2, width)
+        left = pygame.draw.circle(surface, color, (x - heart_size//2, y - heart_size//3), heart_size//2, width)
+        right = pygame.draw.circle(surface, color, (x + heart_size//2, y - heart_size//3), heart_size//2, width)
         
         # Bottom triangle
         points = [
@@ -189,62 +304,82 @@ class MiniPaint:
             (x + heart_size, y),
             (x, y + heart_size)
         ]
-        pygame.draw.polygon(surface, color, points, width)
+        bottom = pygame.draw.polygon(surface, color, points, width)
+        return bottom.unionall([left, right])
+    
+    def _draw_rect_from_points(self, surface: pygame.Surface, color: Tuple[int, int, int], width: int,
+                               start: Tuple[int, int], end: Tuple[int, int]) -> pygame.Rect:
+        """Draw a rectangle spanning two corner points"""
+        rect = pygame.Rect(
+            min(start[0], end[0]),
+            min(start[1], end[1]),
+            abs(end[0] - start[0]),
+            abs(end[1] - start[1])
+        )
+        return pygame.draw.rect(surface, color, rect, width)
+    
+    def _draw_circle_from_points(self, surface: pygame.Surface, color: Tuple[int, int, int], width: int,
+                                 start: Tuple[int, int], end: Tuple[int, int]) -> Optional[pygame.Rect]:
+        """Draw a circle centered on start passing through end"""
+        radius = int(math.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2))
+        if radius > 0:
+            return pygame.draw.circle(surface, color, start, radius, width)
+        return None
+    
+    def _draw_triangle_from_points(self, surface: pygame.Surface, color: Tuple[int, int, int], width: int,
+                                   start: Tuple[int, int], end: Tuple[int, int]) -> pygame.Rect:
+        """Draw a triangle with its apex at the top middle of the start/end box"""
+        box_width = end[0] - start[0]
+        box_height = end[1] - start[1]
+        points = [
+            (start[0] + box_width // 2, start[1]),
+            (start[0], start[1] + box_height),
+            (start[0] + box_width, start[1] + box_height)
+        ]
+        return pygame.draw.polygon(surface, color, points, width)
+    
+    def _draw_star_from_points(self, surface: pygame.Surface, color: Tuple[int, int, int], width: int,
+                               start: Tuple[int, int], end: Tuple[int, int]) -> Optional[pygame.Rect]:
+        """Draw a star centered on start, sized by the horizontal drag distance"""
+        radius = abs(end[0] - start[0]) // 2
+        if radius > 0:
+            return self.draw_star(surface, start, radius, color, width)
+        return None
+    
+    def _draw_heart_from_points(self, surface: pygame.Surface, color: Tuple[int, int, int], width: int,
+                                start: Tuple[int, int], end: Tuple[int, int]) -> Optional[pygame.Rect]:
+        """Draw a heart centered on start, sized by the horizontal drag distance"""
+        size = abs(end[0] - start[0])
+        if size > 0:
+            return self.draw_heart(surface, start, size, color, width)
+        return None
+    
+    def clear_preview(self):
+        """Clear the area of the preview surface covered by the last preview"""
+        if self._prev_preview_rect:
+            self.preview_surface.fill((0, 0, 0, 0), self._prev_preview_rect)
+            self.mark_canvas_dirty(self._prev_preview_rect)
+            self._prev_preview_rect = None
     
     def draw_preview(self, end_pos: Tuple[int, int]):
         """Draw preview of current shape being drawn"""
         if not self.show_preview or not self.start_pos:
             return
         
-        self.preview_surface.fill((0, 0, 0, 0))
-        
-        if self.current_tool == Tool.LINE:
-            pygame.draw.line(self.preview_surface, self.current_color, 
-                           self.start_pos, end_pos, self.brush_size)
-        
-        elif self.current_tool == Tool.RECTANGLE:
-            rect = pygame.Rect(
-                min(self.start_pos[0], end_pos[0]),
-                min(self.start_pos[1], end_pos[1]),
-                abs(end_pos[0] - self.start_pos[0]),
-                abs(end_pos[1] - self.start_pos[1])
-            )
-            pygame.draw.rect(self.preview_surface, self.current_color, rect, self.brush_size)
-        
-        elif self.current_tool == Tool.CIRCLE:
-            radius = int(math.sqrt((end_pos[0] - self.start_pos[0])**2 + 
-                                 (end_pos[1] - self.start_pos[1])**2))
-            if radius > 0:
-                pygame.draw.circle(self.preview_surface, self.current_color, 
-                                 self.start_pos, radius, self.brush_size)
-        
-        elif self.current_tool == Tool.TRIANGLE:
-            width = end_pos[0] - self.start_pos[0]
-            height = end_pos[1] - self.start_pos[1]
-            points = [
-                (self.start_pos[0] + width // 2, self.start_pos[1]),
-                (self.start_pos[0], self.start_pos[1] + height),
-                (self.start_pos[0] + width, self.start_pos[1] + height)
-            ]
-            pygame.draw.polygon(self.preview_surface, self.current_color, points, self.brush_size)
-        
-        elif self.current_tool == Tool.STAR:
-            radius = abs(end_pos[0] - self.start_pos[0]) // 2
-            if radius > 0:
-                self.draw_star(self.preview_surface, self.start_pos, radius, 
-                             self.current_color, self.brush_size)
-        
-        elif self.current_tool == Tool.HEART:
-            size = abs(end_pos[0] - self.start_pos[0])
-            if size > 0:
-                self.draw_heart(self.preview_surface, self.start_pos, size, 
-                              self.current_color, self.brush_size)
+        self.clear_preview()
+        drawer = self._shape_drawers.get(self.current_tool)
+        dirty_rect = drawer and drawer(self.preview_surface, self.current_color, self.brush_size,
+                                       self.start_pos, end_pos)
+        
+        self._prev_preview_rect = dirty_rect
+        self.mark_canvas_dirty(dirty_rect)
     
     def handle_drawing(self, pos: Tuple[int, int], mouse_pressed: bool):
         """Handle drawing operations"""
-        canvas_pos = self.get_canvas_pos(pos)
-        if not canvas_pos:
+        canvas_x, canvas_y, inside = self.get_canvas_pos(pos)
+        if not inside:
             return
+        canvas_pos = (canvas_x, canvas_y)
         
         if mouse_pressed and not self.is_drawing:
             # Start drawing
@@ -252,86 +387,80 @@ class MiniPaint:
             self.start_pos = canvas_pos
             self.last_pos = canvas_pos
             
-            if self.current_tool in [Tool.BRUSH, Tool.PEN, Tool.MARKER, Tool.ERASER]:
-                if self.current_tool == Tool.ERASER:
-                    pygame.draw.circle(self.canvas, WHITE, canvas_pos, self.brush_size // 2)
-                else:
-                    size = self.brush_size
-                    if self.current_tool == Tool.PEN:
-                        size = max(1, size // 2)
-                    elif self.current_tool == Tool.MARKER:
-                        size = int(size * 1.5)
-                    
-                    pygame.draw.circle(self.canvas, self.current_color, canvas_pos, size // 2)
+            if self.current_tool in FREEHAND_TOOLS:
+                # Resolve the stroke color and width once for the whole stroke
+                self._stroke_color = WHITE if self.current_tool == Tool.ERASER else self.current_color
+                self._stroke_size = max(1, int(self.brush_size * BRUSH_SIZE_MULT[self.current_tool]))
+                self.stamp_stroke(canvas_pos, canvas_pos)
         
         elif mouse_pressed and self.is_drawing:
             # Continue drawing
-            if self.current_tool in [Tool.BRUSH, Tool.PEN, Tool.MARKER, Tool.ERASER]:
+            if self.current_tool in FREEHAND_TOOLS:
                 if self.last_pos:
-                    if self.current_tool == Tool.ERASER:
-                        self.draw_line_smooth(self.canvas, self.last_pos, canvas_pos, WHITE, self.brush_size)
-                    else:
-                        size = self.brush_size
-                        if self.current_tool == Tool.PEN:
-                            size = max(1, size // 2)
-                        elif self.current_tool == Tool.MARKER:
-                            size = int(size * 1.5)
-                        
-                        self.draw_line_smooth(self.canvas, self.last_pos, canvas_pos, self.current_color, size)
+                    self.stamp_stroke(self.last_pos, canvas_pos)
                 
                 self.last_pos = canvas_pos
-            else:
+            elif self.current_tool in SHAPE_TOOLS:
                 # Shape tools - show preview
                 self.draw_preview(canvas_pos)
         
         elif not mouse_pressed and self.is_drawing:
             # Finish drawing
             self.is_drawing = False
+            dirty_rect = None
             
-            if self.current_tool == Tool.LINE and self.start_pos:
-                pygame.draw.line(self.canvas, self.current_color, self.start_pos, canvas_pos, self.brush_size)
-            
-            elif self.current_tool == Tool.RECTANGLE and self.start_pos:
-                rect = pygame.Rect(
-                    min(self.start_pos[0], canvas_pos[0]),
-                    min(self.start_pos[1], canvas_pos[1]),
-                    abs(canvas_pos[0] - self.start_pos[0]),
-                    abs(canvas_pos[1] - self.start_pos[1])
-                )
-                pygame.draw.rect(self.canvas, self.current_color, rect, self.brush_size)
-            
-            elif self.current_tool == Tool.CIRCLE and self.start_pos:
-                radius = int(math.sqrt((canvas_pos[0] - self.start_pos[0])**2 + 
-                                     (canvas_pos[1] - self.start_pos[1])**2))
-                if radius > 0:
-                    pygame.draw.circle(self.canvas, self.current_color, self.start_pos, radius, self.brush_size)
-            
-            elif self.current_tool == Tool.TRIANGLE and self.start_pos:
-                width = canvas_pos[0] - self.start_pos[0]
-                height = canvas_pos[1] - self.start_pos[1]
-                points = [
-                    (self.start_pos[0] + width // 2, self.start_pos[1]),
-                    (self.start_pos[0], self.start_pos[1] + height),
-                    (self.start_pos[0] + width, self.start_pos[1] + height)
-                ]
-                pygame.draw.polygon(self.canvas, self.current_color, points, self.brush_size)
-            
-            elif self.current_tool == Tool.STAR and self.start_pos:
-                radius = abs(canvas_pos[0] - self.start_pos[0]) // 2
-                if radius > 0:
-                    self.draw_star(self.canvas, self.start_pos, radius, self.current_color, self.brush_size)
-            
-            elif self.current_tool == Tool.HEART and self.start_pos:
-                size = abs(canvas_pos[0] - self.start_pos[0])
-                if size > 0:
-                    self.draw_heart(self.canvas, self.start_pos, size, self.current_color, self.brush_size)
+            drawer = self._shape_drawers.get(self.current_tool)
+            if drawer and self.start_pos:
+                dirty_rect = drawer(self.canvas, self.current_color, self.brush_size,
+                                    self.start_pos, canvas_pos)
             
             # Clear preview and save state
-            self.preview_surface.fill((0, 0, 0, 0))
+            self.mark_canvas_dirty(dirty_rect)
+            self.clear_preview()
             self.save_state()
             self.start_pos = None
             self.last_pos = None
     
+    def handle_toolbar_clicks(self):
+        """Apply tool and action button presses before the toolbar is drawn"""
+        if not pygame.mouse.get_pressed()[0]:
+            return
+        mouse_pos = pygame.mouse.get_pos()
+        
+        for tool, button_rect in self._tool_button_rects:
+            if button_rect.collidepoint(mouse_pos):
+                self.current_tool = tool
+        
+        if self._undo_rect.collidepoint(mouse_pos):
+            self.undo()
+        elif self._redo_rect.collidepoint(mouse_pos):
+            self.redo()
+        elif self._clear_rect.collidepoint(mouse_pos):
+            self.clear_canvas()
+        elif self._save_rect.collidepoint(mouse_pos):
+            self.save_canvas()
+        elif self._back_rect.collidepoint(mouse_pos):
+            self.show_landing = True
+    
+    def handle_palette_click(self, pos: Tuple[int, int]):
+        """Select the palette color under pos, if any"""
+        dx = pos[0] - self._palette_origin[0]
+        dy = pos[1] - self._palette_origin[1]
+        col, col_offset = divmod(dx, 35)
+        row, row_offset = divmod(dy, 35)
+        
+        # Ignore the gaps between swatches
+        if col_offset < 30 and row_offset < 30:
+            color = self._palette_lookup.get((col, row))
+            if color is not None:
+                self.current_color = color
+    
+    def handle_slider(self, pos: Tuple[int, int]):
+        """Update the brush size if pos is on the size slider"""
+        if self._slider_rect.collidepoint(pos):
+            relative_x = pos[0] - self._slider_rect.x
+            self.brush_size = max(1, min(100, int(relative_x / self._slider_rect.width * 99) + 1))
+    
     def draw_button(self, surface: pygame.Surface, rect: pygame.Rect, text: str, 
                    color: Tuple[int, int, int], text_color: Tuple[int, int, int] = WHITE,
                    font: pygame.font.Font = None, border_radius: int = 8) -> bool:
@@ -344,7 +473,7 @@ class MiniPaint:
         pygame.draw.rect(surface, DARK_GRAY, rect, 2, border_radius=border_radius)
         
         # Draw text
-        text_surface = font.render(text, True, text_color)
+        text_surface = render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -353,27 +482,39 @@ class MiniPaint:
         mouse_clicked = pygame.mouse.get_pressed()[0]
         return rect.collidepoint(mouse_pos) and mouse_clicked
     
-    def draw_tool_button(self, surface: pygame.Surface, rect: pygame.Rect, 
-                        tool: Tool, icon_text: str) -> bool:
-        """Draw a tool button"""
+    def draw_tool_button(self, surface: pygame.Surface, rect: pygame.Rect, tool: Tool):
+        """Draw a tool button over its cached background"""
         is_selected = self.current_tool == tool
-        color = BLUE if is_selected else LIGHT_GRAY
-        text_color = WHITE if is_selected else BLACK
         
-        return self.draw_button(surface, rect, icon_text, color, text_color, self.font_medium)
+        # Unselected backgrounds are part of the toolbar cache
+        if is_selected:
+            pygame.draw.rect(surface, BLUE, rect, border_radius=8)
+            pygame.draw.rect(surface, DARK_GRAY, rect, 2, border_radius=8)
+        
+        icon_surface = self._tool_icon_cache[tool][is_selected]
+        surface.blit(icon_surface, icon_surface.get_rect(center=rect.center))
     
-    def draw_landing_page(self):
-        """Draw the landing page"""
-        # Gradient background
+    def _build_landing_background(self) -> pygame.Surface:
+        """Render the landing page gradient background"""
+        # Build a one pixel wide column, then stretch it across the window
+        column = bytearray()
         for y in range(WINDOW_HEIGHT):
             color_ratio = y / WINDOW_HEIGHT
             r = int(75 + (30 - 75) * color_ratio)
             g = int(0 + (41 - 0) * color_ratio)
             b = int(130 + (81 - 130) * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+            column += bytes((r, g, b))
+        
+        column_surface = pygame.image.frombytes(bytes(column), (1, WINDOW_HEIGHT), "RGB")
+        return pygame.transform.scale(column_surface, (WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    
+    def draw_landing_page(self):
+        """Draw the landing page"""
+        # Gradient background
+        self.screen.blit(self._landing_bg, (0, 0))
         
         # Title
-        title_text = self.font_large.render("Mini Paint", True, WHITE)
+        title_text = render_text(self.font_large, "Mini Paint", WHITE)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         self.screen.blit(title_text, title_rect)
         
@@ -382,132 +523,121 @@ class MiniPaint:
         if self.draw_button(self.screen, start_button, "Start Creating", PURPLE, WHITE, self.font_medium, 15):
             self.show_landing = False
     
-    def draw_toolbar(self):
-        """Draw the toolbar"""
+    def _build_toolbar_cache(self):
+        """Render the static toolbar chrome onto the toolbar cache surface"""
+        cache = self._toolbar_cache
+        
         # Toolbar background
-        toolbar_rect = pygame.Rect(0, 0, TOOLBAR_WIDTH, WINDOW_HEIGHT)
-        pygame.draw.rect(self.screen, (240, 240, 250), toolbar_rect)
-        pygame.draw.line(self.screen, GRAY, (TOOLBAR_WIDTH, 0), (TOOLBAR_WIDTH, WINDOW_HEIGHT), 2)
+        cache.fill((240, 240, 250))
+        pygame.draw.line(cache, GRAY, (TOOLBAR_WIDTH, 0), (TOOLBAR_WIDTH, WINDOW_HEIGHT), 2)
         
         y_offset = 20
         
         # Title
         title_text = self.font_medium.render("Mini Paint Studio", True, DARK_GRAY)
-        self.screen.blit(title_text, (20, y_offset))
+        cache.blit(title_text, (20, y_offset))
         y_offset += 50
         
         # Tools section
         tools_text = self.font_small.render("Drawing Tools", True, DARK_GRAY)
-        self.screen.blit(tools_text, (20, y_offset))
+        cache.blit(tools_text, (20, y_offset))
         y_offset += 30
         
-        # Tool buttons (3 columns)
-        tools = [
-            (Tool.BRUSH, "🖌️"), (Tool.PEN, "✏️"), (Tool.MARKER, "🖍️"),
-            (Tool.ERASER, "🧽"), (Tool.LINE, "📏"), (Tool.RECTANGLE, "⬜"),
-            (Tool.CIRCLE, "⭕"), (Tool.TRIANGLE, "🔺"), (Tool.STAR, "⭐"),
-            (Tool.HEART, "❤️")
-        ]
-        
-        for i, (tool, icon) in enumerate(tools):
+        # Tool button backgrounds (3 columns)
+        self._tool_button_rects = []
+        for i, (tool, _) in enumerate(TOOL_BUTTONS):
             row = i // 3
             col = i % 3
             x = 20 + col * 100
             y = y_offset + row * 50
             
             button_rect = pygame.Rect(x, y, 90, 40)
-            if self.draw_tool_button(self.screen, button_rect, tool, icon):
-                self.current_tool = tool
+            pygame.draw.rect(cache, LIGHT_GRAY, button_rect, border_radius=8)
+            pygame.draw.rect(cache, DARK_GRAY, button_rect, 2, border_radius=8)
+            self._tool_button_rects.append((tool, button_rect))
         
-        y_offset += len(tools) // 3 * 50 + 50
+        # Skip brush size label and slider
+        y_offset = self._slider_rect.y + 50
         
-        # Brush size
-        size_text = self.font_small.render(f"Brush Size: {self.brush_size}px", True, DARK_GRAY)
-        self.screen.blit(size_text, (20, y_offset))
+        # Color palette
+        color_text = self.font_small.render("Color Palette", True, DARK_GRAY)
+        cache.blit(color_text, (20, y_offset))
         y_offset += 30
         
-        # Size slider (simplified)
-        slider_rect = pygame.Rect(20, y_offset, 250, 20)
-        pygame.draw.rect(self.screen, LIGHT_GRAY, slider_rect, border_radius=10)
-        
-        # Slider handle
-        handle_x = 20 + int((self.brush_size - 1) / 99 * 250)
-        handle_rect = pygame.Rect(handle_x - 10, y_offset - 5, 20, 30)
-        pygame.draw.rect(self.screen, BLUE, handle_rect, border_radius=10)
+        # Color palette grid
+        palette_origin = (20, y_offset + 60)
+        self._build_palette_surface(palette_origin)
+        cache.blit(self._palette_surf, palette_origin)
+        y_offset += 200
         
-        # Handle slider interaction
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        if slider_rect.collidepoint(mouse_pos) and mouse_pressed:
-            relative_x = mouse_pos[0] - 20
-            self.brush_size = max(1, min(100, int(relative_x / 250 * 99) + 1))
+        # Action button rects (drawn per frame since their colors change)
+        button_width = 100
+        button_height = 40
+        button_spacing = 10
         
-        y_offset += 50
+        self._undo_rect = pygame.Rect(20, y_offset, button_width, button_height)
+        self._redo_rect = pygame.Rect(20 + button_width + button_spacing, y_offset, button_width, button_height)
+        y_offset += button_height + button_spacing
         
-        # Color palette
-        color_text = self.font_small.render("Color Palette", True, DARK_GRAY)
-        self.screen.blit(color_text, (20, y_offset))
-        y_offset += 30
+        self._clear_rect = pygame.Rect(20, y_offset, button_width, button_height)
+        self._save_rect = pygame.Rect(20 + button_width + button_spacing, y_offset, button_width, button_height)
+        y_offset += button_height + button_spacing
         
-        # Current color display
-        current_color_rect = pygame.Rect(20, y_offset, 50, 50)
-        pygame.draw.rect(self.screen, self.current_color, current_color_rect)
-        pygame.draw.rect(self.screen, BLACK, current_color_rect, 2)
+        self._back_rect = pygame.Rect(20, y_offset, button_width * 2 + button_spacing, button_height)
+    
+    def _build_palette_surface(self, origin: Tuple[int, int]):
+        """Render the color swatches and index them by (column, row) cell"""
+        rows = (len(COLOR_PALETTE) + 7) // 8
+        self._palette_surf = pygame.Surface((8 * 35, rows * 35), pygame.SRCALPHA)
+        self._palette_origin = origin
+        self._palette_lookup = {}
         
-        # Color palette grid
         for i, color in enumerate(COLOR_PALETTE):
             row = i // 8
             col = i % 8
-            x = 20 + col * 35
-            y = y_offset + 60 + row * 35
+            x = col * 35
+            y = row * 35
             
             color_rect = pygame.Rect(x, y, 30, 30)
-            pygame.draw.rect(self.screen, color, color_rect)
-            pygame.draw.rect(self.screen, BLACK, color_rect, 1)
-            
-            # Check if color clicked
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_clicked = pygame.mouse.get_pressed()[0]
-            if color_rect.collidepoint(mouse_pos) and mouse_clicked:
-                self.current_color = color
-        
-        y_offset += 200
-        
-        # Action buttons
-        button_width = 100
-        button_height = 40
-        button_spacing = 10
+            pygame.draw.rect(self._palette_surf, color, color_rect)
+            pygame.draw.rect(self._palette_surf, BLACK, color_rect, 1)
+            self._palette_lookup[(col, row)] = color
+    
+    def draw_toolbar(self):
+        """Draw the toolbar"""
+        # Static background, labels and palette
+        self.screen.blit(self._toolbar_cache, (0, 0))
         
-        # Undo button
-        undo_rect = pygame.Rect(20, y_offset, button_width, button_height)
-        if self.draw_button(self.screen, undo_rect, "Undo", GRAY if self.history_index <= 0 else GREEN):
-            if self.history_index > 0:
-                self.undo()
+        # Tool buttons: selected highlight and icons
+        for tool, button_rect in self._tool_button_rects:
+            self.draw_tool_button(self.screen, button_rect, tool)
         
-        # Redo button
-        redo_rect = pygame.Rect(20 + button_width + button_spacing, y_offset, button_width, button_height)
-        if self.draw_button(self.screen, redo_rect, "Redo", GRAY if self.history_index >= len(self.history) - 1 else GREEN):
-            if self.history_index < len(self.history) - 1:
-                self.redo()
+        # Brush size label above the slider
+        size_text = render_text(self.font_small, f"Brush Size: {self.brush_size}px", DARK_GRAY)
+        self.screen.blit(size_text, (20, self._slider_rect.y - 30))
         
-        y_offset += button_height + button_spacing
+        # Size slider (simplified, interaction handled in handle_slider)
+        pygame.draw.rect(self.screen, LIGHT_GRAY, self._slider_rect, border_radius=10)
         
-        # Clear button
-        clear_rect = pygame.Rect(20, y_offset, button_width, button_height)
-        if self.draw_button(self.screen, clear_rect, "Clear", RED):
-            self.clear_canvas()
+        # Slider handle
+        handle_x = self._slider_rect.x + int((self.brush_size - 1) / 99 * self._slider_rect.width)
+        handle_rect = pygame.Rect(handle_x - 10, self._slider_rect.y - 5, 20, 30)
+        pygame.draw.rect(self.screen, BLUE, handle_rect, border_radius=10)
         
-        # Save button
-        save_rect = pygame.Rect(20 + button_width + button_spacing, y_offset, button_width, button_height)
-        if self.draw_button(self.screen, save_rect, "Save", BLUE):
-            self.save_canvas()
+        # Color palette label (cached) sits below the slider
+        y_offset = self._slider_rect.y + 50 + 30
         
-        y_offset += button_height + button_spacing
+        # Current color display
+        current_color_rect = pygame.Rect(20, y_offset, 50, 50)
+        pygame.draw.rect(self.screen, self.current_color, current_color_rect)
+        pygame.draw.rect(self.screen, BLACK, current_color_rect, 2)
         
-        # Back button
-        back_rect = pygame.Rect(20, y_offset, button_width * 2 + button_spacing, button_height)
-        if self.draw_button(self.screen, back_rect, "← Back to Home", PURPLE):
-            self.show_landing = True
+        # Action buttons (clicks handled in handle_toolbar_clicks)
+        self.draw_button(self.screen, self._undo_rect, "Undo", GRAY if len(self.history) <= 1 else GREEN)
+        self.draw_button(self.screen, self._redo_rect, "Redo", GRAY if not self._redo_stack else GREEN)
+        self.draw_button(self.screen, self._clear_rect, "Clear", RED)
+        self.draw_button(self.screen, self._save_rect, "Save", BLUE)
+        self.draw_button(self.screen, self._back_rect, "← Back to Home", PURPLE)
     
     def save_canvas(self):
         """Save the canvas as a PNG file"""
@@ -528,6 +658,21 @@ class MiniPaint:
     
     def draw_main_app(self):
         """Draw the main application interface"""
+        # Apply toolbar presses first so this frame draws and uploads the new state
+        self.handle_toolbar_clicks()
+        
+        # Toolbar and status bar only need uploading when their state changed
+        ui_state = (self.current_tool, self.brush_size, self.current_color,
+                    len(self.history), len(self._redo_stack))
+        if ui_state != self._ui_state:
+            self._ui_state = ui_state
+            self.mark_dirty(pygame.Rect(0, 0, TOOLBAR_WIDTH + 2, WINDOW_HEIGHT))
+            status_y = HEADER_HEIGHT + CANVAS_HEIGHT + 40
+            self.mark_dirty(pygame.Rect(TOOLBAR_WIDTH + 20, status_y,
+                                        CANVAS_WIDTH, WINDOW_HEIGHT - status_y))
+            status_text = f"Tool: {self.current_tool.value.title()} | Size: {self.brush_size}px | History: {len(self.history)}/{len(self.history) + len(self._redo_stack)}"
+            self._status_surf = self.font_small.render(status_text, True, DARK_GRAY)
+        
         # Background
         self.screen.fill((250, 250, 255))
         
@@ -545,18 +690,17 @@ class MiniPaint:
                                 CANVAS_WIDTH, CANVAS_HEIGHT)
         self.screen.blit(self.canvas, canvas_rect)
         
-        # Draw preview if showing
-        if self.show_preview:
-            self.screen.blit(self.preview_surface, canvas_rect)
+        # Draw preview if showing, blending only the area a shape was drawn in
+        if self.show_preview and self._prev_preview_rect:
+            preview_rect = self._prev_preview_rect
+            self.screen.blit(self.preview_surface, canvas_rect.move(preview_rect.topleft), preview_rect)
         
         # Canvas border
         pygame.draw.rect(self.screen, DARK_GRAY, canvas_rect, 2)
         
         # Status bar
         status_y = HEADER_HEIGHT + CANVAS_HEIGHT + 40
-        status_text = f"Tool: {self.current_tool.value.title()} | Size: {self.brush_size}px | History: {self.history_index + 1}/{len(self.history)}"
-        status_surface = self.font_small.render(status_text, True, DARK_GRAY)
-        self.screen.blit(status_surface, (TOOLBAR_WIDTH + 20, status_y))
+        self.screen.blit(self._status_surf, (TOOLBAR_WIDTH + 20, status_y))
     
     def handle_events(self):
         """Handle pygame events"""
@@ -573,6 +717,27 @@ class MiniPaint:
                     self.save_canvas()
                 elif event.key == pygame.K_ESCAPE:
                     self.show_landing = True
+            
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.mark_dirty()
+            
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._mouse_down = True
+                if not self.show_landing:
+                    self.handle_palette_click(event.pos)
+                    self.handle_slider(event.pos)
+                    self.handle_drawing(event.pos, self._mouse_down)
+            
+            elif event.type == pygame.MOUSEMOTION:
+                if not self.show_landing and self._mouse_down:
+                    self.handle_slider(event.pos)
+                if not self.show_landing and (self._mouse_down or self.is_drawing):
+                    self.handle_drawing(event.pos, self._mouse_down)
+            
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                self._mouse_down = False
+                if not self.show_landing:
+                    self.handle_drawing(event.pos, self._mouse_down)
         
         return True
     
@@ -583,11 +748,10 @@ class MiniPaint:
         while running:
             running = self.handle_events()
             
-            # Handle mouse input for drawing
-            if not self.show_landing:
-                mouse_pos = pygame.mouse.get_pos()
-                mouse_pressed = pygame.mouse.get_pressed()[0]
-                self.handle_drawing(mouse_pos, mouse_pressed)
+            # Switching screens repaints the whole window
+            if self.show_landing != self._shown_landing:
+                self._shown_landing = self.show_landing
+                self.mark_dirty()
             
             # Draw appropriate screen
             if self.show_landing:
@@ -595,7 +759,7 @@ class MiniPaint:
             else:
                 self.draw_main_app()
             
-            pygame.display.flip()
+            self.update_display()
             self.clock.tick(60)
         
         pygame.quit()